@@ -2,11 +2,17 @@ from setuptools import find_packages, setup
 
 setup(
     name="upyloadthing",
-    version="0.1.0",
+    version="0.2.1",
     packages=find_packages(),
     install_requires=[
-        "requests>=2.25.0",
-        "pydantic>=2.0.0",
+        "setuptools>=75.8.0,<76.0.0",
+        "pydantic>=2.10.6,<3.0.0",
+        "sqids>=0.5.1,<0.6.0",
+        "httpx>=0.28.1,<0.29.0",
     ],
-    python_requires=">=3.7",
+    extras_require={
+        "orjson": ["orjson>=3.10.15,<4.0.0"],
+        "http2": ["httpx[http2]>=0.28.1,<0.29.0"],
+    },
+    python_requires=">=3.12",
 )
@@ -0,0 +1,53 @@
+from io import BytesIO
+from typing import Dict
+
+import pytest
+import respx
+
+# Names and contents of the in-memory files used by the upload tests
+MOCK_FILE_CONTENTS = {
+    "test.jpg": b"test content",
+    "test.png": b"fake png content",
+    "test1.jpg": b"test1 content",
+    "test2.jpg": b"test2 content",
+    "test1.txt": b"test1 content",
+    "test2.txt": b"test2 content",
+}
+
+
+def _named_file(name: str, content: bytes) -> BytesIO:
+    """Create an in-memory file carrying a file name like an opened file."""
+    file = BytesIO(content)
+    file.name = name
+    return file
+
+
+@pytest.fixture(scope="module")
+def mock_files() -> Dict[str, BytesIO]:
+    """Fixture to create the named mock files shared by the module."""
+    return {
+        name: _named_file(name, content)
+        for name, content in MOCK_FILE_CONTENTS.items()
+    }
+
+
+@pytest.fixture(autouse=True)
+def rewind_mock_files(mock_files):
+    """Fixture to rewind the shared mock files before each test."""
+    for file in mock_files.values():
+        file.seek(0)
+
+
+@pytest.fixture(scope="module")
+def respx_router():
+    """Fixture to mock the HTTP transports once for the whole module."""
+    with respx.mock(assert_all_called=False) as router:
+        yield router
+
+
+@pytest.fixture
+def respx_mock(respx_router):
+    """Fixture to give each test an empty route table on the shared router."""
+    yield respx_router
+    respx_router.clear()
+    respx_router.reset()
@@ -0,0 +1,120 @@
+"""Mock tokens and API payloads shared by the client test modules."""
+
+import base64
+import re
+
+import httpx
+
+from upyloadthing import ACLValue, UTApiOptions, UTtoken
+from upyloadthing.utils import json_dumps
+
+MOCK_TOKEN = base64.b64encode(
+    json_dumps(
+        {
+            "appId": "test-app",
+            "apiKey": "test-key",
+            "regions": ["sea2"],
+        }
+    )
+).decode()
+
+# Decoded form of MOCK_TOKEN, so the shared options skip the token decoding
+MOCK_UTTOKEN = UTtoken(app_id="test-app", api_key="test-key", regions=["sea2"])
+
+MOCK_OPTIONS = UTApiOptions(token=MOCK_UTTOKEN)
+
+ACL_PRIVATE = ACLValue.PRIVATE.value
+ACL_PUBLIC_READ = ACLValue.PUBLIC_READ.value
+
+INGEST_RE = re.compile(r"https://sea2\.ingest\.uploadthing\.com/")
+
+# Identifiers and URLs of the uploaded test file
+FILE_KEY = "AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg="
+FILE_HASH = "dae427dff5fa285fc87a791dc8b7daf1"
+UTFS_URL = f"https://utfs.io/f/{FILE_KEY}"
+UFS_URL = f"https://lhdsot44oz.ufs.sh/f/{FILE_KEY}"
+APP_URL = f"https://utfs.io/a/lhdsot44oz/{FILE_KEY}"
+
+# Ingest response body, serialized once and shared by the upload tests
+UPLOAD_BODY = json_dumps(
+    {
+        "fileHash": FILE_HASH,
+        "url": UTFS_URL,
+        "ufsUrl": UFS_URL,
+        "appUrl": APP_URL,
+    }
+)
+
+
+# Mocked API responses shared by the tests. respx clones a returned
+# response for every call, so the same instance can be reused.
+UPLOAD_RESPONSE = httpx.Response(200, content=UPLOAD_BODY)
+
+DELETE_RESPONSE = httpx.Response(
+    200, json={"success": True, "deletedCount": 1}
+)
+
+LIST_RESPONSE = httpx.Response(
+    200,
+    json={
+        "has_more": False,
+        "files": [
+            {
+                "id": "file_123",
+                "key": FILE_KEY,
+                "name": "test.jpg",
+                "status": "ready",
+                "size": 1024,
+                "uploadedAt": 1704067200,
+            }
+        ],
+    },
+)
+
+USAGE_RESPONSE = httpx.Response(
+    200,
+    json={
+        "totalBytes": 1024,
+        "appTotalBytes": 2048,
+        "filesUploaded": 10,
+        "limitBytes": 5000000,
+    },
+)
+
+RENAME_RESPONSE = httpx.Response(
+    200, json={"success": True, "renamedCount": 2}
+)
+
+ACL_RESPONSE = httpx.Response(200, json={"success": True, "updatedCount": 2})
+
+
+# Update payloads for the rename and ACL tests; the clients never mutate them
+RENAME_UPDATES_BY_KEY = [
+    {"fileKey": "file_key_1", "newName": "renamed1.jpg"},
+    {"fileKey": "file_key_2", "newName": "renamed2.png"},
+]
+
+RENAME_UPDATES_BY_CUSTOM_ID = [
+    {"customId": "custom_123", "newName": "new_name.jpg"},
+    {"customId": "custom_456", "newName": "other_name.png"},
+]
+
+RENAME_UPDATES_MIXED = [
+    {"fileKey": "file_key_123", "newName": "new_name.jpg"},
+    {"customId": "custom_456", "newName": "other_name.png"},
+]
+
+ACL_UPDATES_BY_KEY = [
+    {"fileKey": "file_key_1", "acl": ACL_PRIVATE},
+    {"fileKey": "file_key_2", "acl": ACL_PUBLIC_READ},
+]
+
+ACL_UPDATES_BY_CUSTOM_ID = [
+    {"customId": "custom_123", "acl": ACL_PRIVATE},
+    {"customId": "custom_456", "acl": ACL_PUBLIC_READ},
+]
+
+ACL_UPDATES_MIXED = [
+    {"fileKey": "file_key_123", "acl": ACL_PRIVATE},
+    {"customId": "custom_456", "acl": ACL_PUBLIC_READ},
+]
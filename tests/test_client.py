@@ -1,13 +1,40 @@
-import base64
-import json
+import threading
+import time
 from io import BytesIO
+from typing import BinaryIO, List
 
+import httpcore
 import httpx
 import pytest
 import respx
 
+from tests.mocks import (
+    ACL_PUBLIC_READ,
+    ACL_RESPONSE,
+    ACL_UPDATES_BY_CUSTOM_ID,
+    ACL_UPDATES_BY_KEY,
+    ACL_UPDATES_MIXED,
+    APP_URL,
+    DELETE_RESPONSE,
+    FILE_HASH,
+    FILE_KEY,
+    INGEST_RE,
+    LIST_RESPONSE,
+    MOCK_OPTIONS,
+    MOCK_TOKEN,
+    MOCK_UTTOKEN,
+    RENAME_RESPONSE,
+    RENAME_UPDATES_BY_CUSTOM_ID,
+    RENAME_UPDATES_BY_KEY,
+    RENAME_UPDATES_MIXED,
+    UFS_URL,
+    UPLOAD_BODY,
+    UPLOAD_RESPONSE,
+    USAGE_RESPONSE,
+    UTFS_URL,
+)
 from upyloadthing import (
-    ACLValue,
+    BatchRequestError,
     DeleteFileResponse,
     ListFileResponse,
     RenameFilesResponse,
@@ -17,33 +44,15 @@ from upyloadthing import (
     UTApi,
     UTApiOptions,
 )
-from upyloadthing.base_client import API_URL
-
-# Test data
-MOCK_TOKEN = base64.b64encode(
-    json.dumps(
-        {
-            "appId": "test-app",
-            "apiKey": "test-key",
-            "regions": ["sea2"],
-        }
-    ).encode()
-).decode()
+from upyloadthing.base_client import API_URL, _guess_type
+from upyloadthing.utils import json_loads
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ut_api():
-    """Fixture to create a UTApi instance with mock token."""
-    options = UTApiOptions(token=MOCK_TOKEN)
-    return UTApi(options)
-
-
-@pytest.fixture
-def mock_file():
-    """Fixture to create a mock file."""
-    file = BytesIO(b"test content")
-    file.name = "test.jpg"
-    return file
+    """Fixture to create a UTApi instance shared by the module."""
+    with UTApi(MOCK_OPTIONS) as api:
+        yield api
 
 
 def test_init_with_options():
@@ -53,6 +62,96 @@ def test_init_with_options():
     assert api.token.app_id == "test-app"
     assert api.token.api_key == "test-key"
     assert api.region == "eu-west-1"
+    assert api.ingest_url == "https://eu-west-1.ingest.uploadthing.com"
+
+
+def test_init_does_not_share_decoded_token():
+    """Test clients built from the same token each own their decoded copy."""
+    first = UTApi(UTApiOptions(token=MOCK_TOKEN))
+    first.token.regions.append("eu-west-1")
+    second = UTApi(UTApiOptions(token=MOCK_TOKEN))
+    assert second.token is not first.token
+    assert second.token.regions == ["sea2"]
+
+
+def test_init_with_decoded_token():
+    """Test UTApi initialization with an already decoded token."""
+    api = UTApi(UTApiOptions(token=MOCK_UTTOKEN))
+    assert api.token is MOCK_UTTOKEN
+    assert api.region == "sea2"
+    assert api.ingest_url == "https://sea2.ingest.uploadthing.com"
+
+
+def test_init_max_concurrency(monkeypatch):
+    """Test max_concurrency is read from options, then the environment."""
+    monkeypatch.setenv("UPLOADTHING_MAX_CONCURRENCY", "4")
+    assert UTApi(MOCK_OPTIONS).max_concurrency == 4
+    options = UTApiOptions(token=MOCK_TOKEN, max_concurrency=8)
+    assert UTApi(options).max_concurrency == 8
+
+
+@pytest.mark.parametrize("value", ["many", "0", "-2", "1.5"])
+def test_init_invalid_max_concurrency(monkeypatch, value):
+    """Test an invalid UPLOADTHING_MAX_CONCURRENCY is rejected by name."""
+    monkeypatch.setenv("UPLOADTHING_MAX_CONCURRENCY", value)
+    with pytest.raises(ValueError, match="UPLOADTHING_MAX_CONCURRENCY"):
+        UTApi(MOCK_OPTIONS)
+
+
+def test_upload_concurrency_is_bounded_by_pool():
+    """Test parallel uploads never exceed the connection pool size."""
+    options = UTApiOptions(
+        token=MOCK_TOKEN, max_concurrency=32, max_connections=4
+    )
+    api = UTApi(options)
+    assert api._upload_concurrency(100) == 4
+    assert api._upload_concurrency(2) == 2
+    assert api._upload_concurrency(0) == 1
+    assert api._batch_concurrency(100) == 4
+    assert api._batch_concurrency(0) == 1
+
+
+def test_init_with_http2():
+    """Test the HTTP client is created with HTTP/2 support when enabled."""
+    pytest.importorskip("h2")
+    api = UTApi(UTApiOptions(token=MOCK_TOKEN, http2=True))
+    assert api._transport_kwargs()["http2"] is True
+
+
+def test_init_connection_options():
+    """Test connection pool and retry settings."""
+    api = UTApi(MOCK_OPTIONS)
+    assert api.max_connections == 100
+    assert api.max_keepalive_connections == 50
+    assert api.retries == 3
+
+    options = UTApiOptions(
+        token=MOCK_TOKEN,
+        max_connections=10,
+        max_keepalive_connections=5,
+        retries=0,
+    )
+    kwargs = UTApi(options)._transport_kwargs()
+    assert kwargs["limits"] == httpx.Limits(
+        max_connections=10, max_keepalive_connections=5
+    )
+    assert kwargs["retries"] == 0
+
+
+def test_init_uses_environment_proxy(monkeypatch):
+    """Test requests are routed through the proxy set in the environment."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    monkeypatch.setenv("NO_PROXY", "localhost")
+    api = UTApi(MOCK_OPTIONS)
+
+    transport = api._client._transport_for_url(httpx.URL(API_URL))
+    assert transport is not api._client._transport
+    assert isinstance(transport, httpx.HTTPTransport)
+    assert isinstance(transport._pool, httpcore.HTTPProxy)
+    assert transport._pool._proxy_url.host == b"proxy.example"
+
+    local = api._client._transport_for_url(httpx.URL("https://localhost"))
+    assert local is api._client._transport
 
 
 def test_init_without_token():
@@ -61,207 +160,392 @@ def test_init_without_token():
         UTApi(UTApiOptions(token=None))
 
 
+def test_context_manager_closes_client():
+    """Test the pooled HTTP client is closed when leaving the context."""
+    with UTApi(MOCK_OPTIONS) as api:
+        assert not api._client.is_closed
+    assert api._client.is_closed
+
+
 def test_make_headers(ut_api):
     """Test header generation."""
     headers = ut_api._make_headers()
     assert headers["x-uploadthing-api-key"] == "test-key"
     assert "x-uploadthing-version" in headers
     assert "x-uploadthing-be-adapter" in headers
+    # Sent by default with every request
+    for name, value in headers.items():
+        assert ut_api._client.headers[name] == value
+
+
+@pytest.mark.parametrize(
+    "names, types, kwargs",
+    [
+        (["test.jpg"], ["image/jpeg"], {}),
+        (["test1.jpg", "test2.jpg"], ["image/jpeg", "image/jpeg"], {}),
+        (["test.png", "test.jpg"], ["image/png", "image/jpeg"], {}),
+        (
+            ["test1.txt", "test2.txt"],
+            ["text/plain", "text/plain"],
+            {"content_disposition": "attachment"},
+        ),
+    ],
+    ids=["single", "multiple", "different_types", "custom_disposition"],
+)
+def test_upload_files(
+    respx_mock: respx.MockRouter, ut_api, mock_files, names, types, kwargs
+):
+    """Test uploading one or more files."""
+    files = [mock_files[name] for name in names]
+    route = respx_mock.put(url__regex=INGEST_RE).mock(
+        return_value=UPLOAD_RESPONSE
+    )
 
+    # A single file is passed as is rather than wrapped in a list
+    result = ut_api.upload_files(
+        files if len(files) > 1 else files[0], **kwargs
+    )
+    assert isinstance(result, list)
+    assert [r.name for r in result] == names
+    assert [r.type for r in result] == types
+    assert [r.size for r in result] == [len(f.getvalue()) for f in files]
+    for r in result:
+        assert type(r) is UploadResult
+        assert r.file_key is not None  # Generated dynamically
+        assert r.file_hash == FILE_HASH
+        assert r.url == UTFS_URL
+        assert r.ufs_url == UFS_URL
+        assert r.app_url == APP_URL
+        assert r.server_data is None  # Default value from schema
+
+    assert route.call_count == len(files)
+    disposition = kwargs.get("content_disposition", "inline")
+    for call in route.calls:
+        params = call.request.url.params
+        assert params["x-ut-content-disposition"] == disposition
+
+
+@pytest.mark.parametrize(
+    "file_name, expected",
+    [
+        ("photo.jpg", "image/jpeg"),
+        ("photo.v2.png", "image/png"),
+        ("archive.tar.gz", "application/x-tar"),
+        ("notes", "application/octet-stream"),
+        (".hidden", "application/octet-stream"),
+    ],
+)
+def test_guess_type(file_name, expected):
+    """Test MIME types are guessed from the file name suffixes."""
+    assert _guess_type(file_name) == expected
+
+
+def test_prepare_file_data_names_unnamed_streams(ut_api):
+    """Test unnamed streams are named after their (unique) file seed."""
+    file_data = ut_api._prepare_file_data(BytesIO(b"data"), "inline", None)
+    assert file_data["name"] == f"upload_{file_data['custom_id']}"
+    assert file_data["size"] == 4
+
+
+def test_prepare_files_data_uses_distinct_seeds(ut_api):
+    """Test each file of a batch gets its own random seed."""
+    files: List[BinaryIO] = [BytesIO(b"data") for _ in range(3)]
+    files_data = ut_api._prepare_files_data(files, "inline", None)
+    seeds = [file_data["custom_id"] for file_data in files_data]
+    assert len(set(seeds)) == 3
+    assert all(len(seed) == 32 for seed in seeds)
+    assert len({file_data["file_key"] for file_data in files_data}) == 3
+
+
+def test_upload_files_respects_max_concurrency(respx_mock: respx.MockRouter):
+    """Test parallel uploads are bounded by max_concurrency."""
+    api = UTApi(UTApiOptions(token=MOCK_TOKEN, max_concurrency=2))
+    files: List[BinaryIO] = []
+    for i in range(5):
+        f = BytesIO(f"test{i} content".encode())
+        f.name = f"test{i}.jpg"
+        files.append(f)
+
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def upload(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return httpx.Response(200, content=UPLOAD_BODY)
+
+    respx_mock.put(url__regex=INGEST_RE).mock(side_effect=upload)
+
+    result = api.upload_files(files)
+    assert [r.name for r in result] == [f.name for f in files]
+    assert max_in_flight == 2
+
+
+def test_upload_result_fields(respx_mock: respx.MockRouter, ut_api):
+    """Test server data is snake_cased and SDK-computed fields win."""
+    respx_mock.put(url__regex=INGEST_RE).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "fileKey": "server-key",
+                "fileHash": FILE_HASH,
+                "url": UTFS_URL,
+                "ufsUrl": UFS_URL,
+                "appUrl": APP_URL,
+                "serverData": {"uploadedBy": "user_1"},
+            },
+        )
+    )
+    file = BytesIO(b"content")
+    file.name = "test.txt"
+
+    result = (ut_api.upload_files(file))[0]
+    assert result.file_key != "server-key"
+    assert result.server_data == {"uploaded_by": "user_1"}
 
-@respx.mock()
-def test_upload_files(respx_mock: respx.MockRouter, ut_api, mock_file):
-    """Test file upload functionality."""
 
-    print(type(respx_mock))
-    upload_response = {
-        "fileHash": "dae427dff5fa285fc87a791dc8b7daf1",
-        "url": "https://utfs.io/f/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-        "ufsUrl": "https://lhdsot44oz.ufs.sh/f/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-        "appUrl": "https://utfs.io/a/lhdsot44oz/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-    }
+def test_upload_file_from_disk(respx_mock: respx.MockRouter, ut_api, tmp_path):
+    """Test uploading a file opened from disk streams its content."""
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"png content")
 
-    respx_mock.put(url__regex="https://sea2.ingest.uploadthing.com/").mock(
-        return_value=httpx.Response(200, json=upload_response)
+    route = respx_mock.put(url__regex=INGEST_RE).mock(
+        return_value=UPLOAD_RESPONSE
     )
 
-    result = ut_api.upload_files(mock_file)[0]
+    with open(path, "rb") as f:
+        result = ut_api.upload_files(f)[0]
+
+    assert result.name == "photo.png"
+    assert result.size == len(b"png content")
+    assert result.type == "image/png"
+    assert b"png content" in route.calls.last.request.content
+    assert b'filename="photo.png"' in route.calls.last.request.content
 
-    # Verify all fields
-    assert result.file_key is not None  # Generated dynamically
-    assert result.name == "test.jpg"
-    assert result.size == len(b"test content")
-    assert result.type == "image/jpeg"
-    assert result.file_hash == "dae427dff5fa285fc87a791dc8b7daf1"
-    assert (
-        result.url
-        == "https://utfs.io/f/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg="
-    )
-    assert (
-        result.ufs_url
-        == "https://lhdsot44oz.ufs.sh/f/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg="
-    )
-    assert (
-        result.app_url
-        == "https://utfs.io/a/lhdsot44oz/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg="
-    )
-    assert result.server_data is None  # Default value from schema
 
+def test_delete_files(respx_mock: respx.MockRouter, ut_api):
+    """Test file deletion."""
+    route = respx_mock.post(f"{API_URL}/v6/deleteFiles").mock(
+        return_value=DELETE_RESPONSE
+    )
 
-@respx.mock()
-def test_upload_multiple_files(respx_mock: respx.MockRouter, ut_api):
-    """Test uploading multiple files."""
-    files = [BytesIO(b"test1 content"), BytesIO(b"test2 content")]
-    for i, f in enumerate(files):
-        f.name = f"test{i + 1}.jpg"
+    result = ut_api.delete_files(FILE_KEY)
+    assert route.called
+    assert isinstance(result, DeleteFileResponse)
+    assert result.success is True
+    assert result.deleted_count == 1
 
-    upload_response = {
-        "fileHash": "dae427dff5fa285fc87a791dc8b7daf1",
-        "url": "https://utfs.io/f/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-        "ufsUrl": "https://lhdsot44oz.ufs.sh/f/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-        "appUrl": "https://utfs.io/a/lhdsot44oz/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-    }
 
-    respx_mock.put(url__regex="https://sea2.ingest.uploadthing.com/").mock(
-        return_value=httpx.Response(200, json=upload_response)
+def test_list_files(respx_mock: respx.MockRouter, ut_api):
+    """Test file listing."""
+    route = respx_mock.post(f"{API_URL}/v6/listFiles").mock(
+        return_value=LIST_RESPONSE
     )
 
-    result = ut_api.upload_files(files)
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert all(isinstance(r, UploadResult) for r in result)
-    for r in result:
-        assert r.file_hash == "dae427dff5fa285fc87a791dc8b7daf1"
-        assert (
-            r.url
-            == "https://utfs.io/f/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg="
-        )
+    result = ut_api.list_files(limit=10, offset=0)
+    assert route.called
+    assert isinstance(result, ListFileResponse)
+    assert len(result.files) == 1
+    assert result.has_more is False
+    assert result.files[0].id == "file_123"
+    assert result.files[0].status == "ready"
 
 
-@respx.mock()
-def test_upload_multiple_files_with_different_types(
-    respx_mock: respx.MockRouter, ut_api
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, {}),
+        ({"limit": 0}, {"limit": 0}),
+        ({"limit": 10, "offset": 0}, {"limit": 10, "offset": 0}),
+    ],
+    ids=["no_params", "zero_limit", "zero_offset"],
+)
+def test_list_files_params(
+    respx_mock: respx.MockRouter, ut_api, kwargs, expected
 ):
-    """Test uploading multiple files with different types."""
-    # Create test files of different types
-    png_file = BytesIO(b"fake png content")
-    png_file.name = "test.png"
+    """Test pagination params are sent whenever they are not None."""
+    route = respx_mock.post(f"{API_URL}/v6/listFiles").mock(
+        return_value=LIST_RESPONSE
+    )
+
+    ut_api.list_files(**kwargs)
+    assert json_loads(route.calls.last.request.content) == expected
 
-    jpg_file = BytesIO(b"fake jpg content")
-    jpg_file.name = "test.jpg"
 
-    files = [png_file, jpg_file]
+def test_delete_files_in_batches(respx_mock: respx.MockRouter, ut_api):
+    """Test large deletions are split into several requests."""
 
-    upload_response = {
-        "fileHash": "dae427dff5fa285fc87a791dc8b7daf1",
-        "url": "https://utfs.io/f/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-        "ufsUrl": "https://lhdsot44oz.ufs.sh/f/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-        "appUrl": "https://utfs.io/a/lhdsot44oz/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-    }
+    def delete(request: httpx.Request) -> httpx.Response:
+        keys = json_loads(request.content)["fileKeys"]
+        return httpx.Response(
+            200, json={"success": True, "deletedCount": len(keys)}
+        )
 
-    respx_mock.put(url__regex="https://sea2.ingest.uploadthing.com/").mock(
-        return_value=httpx.Response(200, json=upload_response)
+    route = respx_mock.post(f"{API_URL}/v6/deleteFiles").mock(
+        side_effect=delete
     )
 
-    result = ut_api.upload_files(files)
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert all(isinstance(r, UploadResult) for r in result)
+    keys = [f"file_key_{i}" for i in range(1500)]
+    result = ut_api.delete_files(keys)
+    assert route.call_count == 2
+    assert result.success is True
+    assert result.deleted_count == 1500
 
-    # Verify file specific details
-    assert result[0].name == "test.png"
-    assert result[0].type == "image/png"
-    assert result[1].name == "test.jpg"
-    assert result[1].type == "image/jpeg"
+
+def _fail_second_delete_batch(request: httpx.Request) -> httpx.Response:
+    """Delete the keys of a batch, failing the batch starting at key 1000."""
+    keys = json_loads(request.content)["fileKeys"]
+    if keys[0] == "file_key_1000":
+        return httpx.Response(500, json={"error": "Internal error"})
+    return httpx.Response(
+        200, json={"success": True, "deletedCount": len(keys)}
+    )
 
 
-@respx.mock()
-def test_upload_multiple_files_with_custom_disposition(
+def test_delete_files_partial_batch_failure(
     respx_mock: respx.MockRouter, ut_api
 ):
-    """Test uploading multiple files with custom content disposition."""
-    files = [BytesIO(b"test1 content"), BytesIO(b"test2 content")]
-    for i, f in enumerate(files):
-        f.name = f"test{i + 1}.txt"
-
-    upload_response = {
-        "fileHash": "dae427dff5fa285fc87a791dc8b7daf1",
-        "url": "https://utfs.io/f/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-        "ufsUrl": "https://lhdsot44oz.ufs.sh/f/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-        "appUrl": "https://utfs.io/a/lhdsot44oz/AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",
-    }
+    """Test a failed batch reports what the other batches deleted."""
+    route = respx_mock.post(f"{API_URL}/v6/deleteFiles").mock(
+        side_effect=_fail_second_delete_batch
+    )
 
-    respx_mock.put(url__regex="https://sea2.ingest.uploadthing.com/").mock(
-        return_value=httpx.Response(200, json=upload_response)
+    keys = [f"file_key_{i}" for i in range(2500)]
+    with pytest.raises(BatchRequestError) as exc_info:
+        ut_api.delete_files(keys)
+    error = exc_info.value
+    # Every batch is sent, even after one of them failed
+    assert route.call_count == 3
+    assert error.result == {"success": True, "deletedCount": 1500}
+    assert error.completed == keys[:1000] + keys[2000:]
+    assert error.failed == keys[1000:2000]
+    assert len(error.errors) == 1
+    assert isinstance(error.__cause__, httpx.HTTPStatusError)
+    assert "Internal error" in str(error)
+
+
+def test_delete_files_single_batch_failure(
+    respx_mock: respx.MockRouter, ut_api
+):
+    """Test a request sent as a single batch raises its own error."""
+    respx_mock.post(f"{API_URL}/v6/deleteFiles").mock(
+        return_value=httpx.Response(500, json={"error": "Internal error"})
     )
 
-    result = ut_api.upload_files(files, content_disposition="attachment")
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert all(isinstance(r, UploadResult) for r in result)
+    with pytest.raises(httpx.HTTPStatusError, match="Internal error"):
+        ut_api.delete_files(["file_key_1"])
 
 
-@respx.mock()
-def test_delete_files(respx_mock: respx.MockRouter, ut_api):
-    """Test file deletion."""
-    delete_response = {"success": True, "deletedCount": 1}
+def test_delete_files_batches_respect_max_concurrency(
+    respx_mock: respx.MockRouter,
+):
+    """Test bulk request batches are bounded by max_concurrency."""
+    api = UTApi(UTApiOptions(token=MOCK_TOKEN, max_concurrency=2))
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def delete(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        keys = json_loads(request.content)["fileKeys"]
+        return httpx.Response(
+            200, json={"success": True, "deletedCount": len(keys)}
+        )
+
+    route = respx_mock.post(f"{API_URL}/v6/deleteFiles").mock(
+        side_effect=delete
+    )
 
+    keys = [f"file_key_{i}" for i in range(5000)]
+    result = api.delete_files(keys)
+    assert route.call_count == 5
+    assert result.deleted_count == 5000
+    assert max_in_flight == 2
+
+
+def test_list_files_cache(respx_mock: respx.MockRouter):
+    """Test list responses are cached until a mutation invalidates them."""
+    api = UTApi(UTApiOptions(token=MOCK_TOKEN, cache_ttl=60))
+    list_route = respx_mock.post(f"{API_URL}/v6/listFiles").mock(
+        return_value=httpx.Response(200, json={"hasMore": False, "files": []})
+    )
     respx_mock.post(f"{API_URL}/v6/deleteFiles").mock(
-        return_value=httpx.Response(200, json=delete_response)
+        return_value=httpx.Response(
+            200, json={"success": True, "deletedCount": 1}
+        )
     )
 
-    result = ut_api.delete_files(
-        "AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg="
+    api.list_files(limit=5)
+    api.list_files(limit=5)
+    assert list_route.call_count == 1
+
+    api.list_files(limit=10)
+    assert list_route.call_count == 2
+
+    api.delete_files("file_key_1")
+    api.list_files(limit=5)
+    assert list_route.call_count == 3
+
+
+def test_failed_mutation_invalidates_cache(respx_mock: respx.MockRouter):
+    """Test a mutation failing after some batches still invalidates cache."""
+    api = UTApi(UTApiOptions(token=MOCK_TOKEN, cache_ttl=60))
+    list_route = respx_mock.post(f"{API_URL}/v6/listFiles").mock(
+        return_value=httpx.Response(200, json={"hasMore": False, "files": []})
+    )
+    respx_mock.post(f"{API_URL}/v6/deleteFiles").mock(
+        side_effect=_fail_second_delete_batch
     )
-    assert isinstance(result, DeleteFileResponse)
-    assert result.success is True
-    assert result.deleted_count == 1
 
+    api.list_files()
+    keys = [f"file_key_{i}" for i in range(1500)]
+    with pytest.raises(BatchRequestError):
+        api.delete_files(keys)
+    api.list_files()
+    assert list_route.call_count == 2
 
-@respx.mock()
-def test_list_files(respx_mock: respx.MockRouter, ut_api):
-    """Test file listing."""
-    list_response = {
-        "has_more": False,
-        "files": [
-            {
-                "id": "file_123",
-                "key": "AlZ3KvVUSx6sMzg3ZDRmZmM5NTRhNDBkMmI5ZWQ5ODg2NWZmODc3MTg=",  # noqa: E501
-                "name": "test.jpg",
-                "status": "ready",
-                "size": 1024,
-                "uploadedAt": 1704067200,
-            }
-        ],
-    }
-
-    respx_mock.post(f"{API_URL}/v6/listFiles").mock(
-        return_value=httpx.Response(200, json=list_response)
+
+def test_failed_upload_invalidates_cache(respx_mock: respx.MockRouter):
+    """Test an upload batch with a failed file still invalidates cache."""
+    api = UTApi(UTApiOptions(token=MOCK_TOKEN, cache_ttl=60))
+    list_route = respx_mock.post(f"{API_URL}/v6/listFiles").mock(
+        return_value=httpx.Response(200, json={"hasMore": False, "files": []})
+    )
+    respx_mock.put(url__regex=INGEST_RE).mock(
+        side_effect=[
+            httpx.Response(200, content=UPLOAD_BODY),
+            httpx.Response(500, json={"error": "Upload failed"}),
+        ]
     )
 
-    result = ut_api.list_files(limit=10, offset=0)
-    assert isinstance(result, ListFileResponse)
-    assert len(result.files) == 1
-    assert result.has_more is False
-    assert result.files[0].id == "file_123"
-    assert result.files[0].status == "ready"
+    api.list_files()
+    files: List[BinaryIO] = [BytesIO(b"first"), BytesIO(b"second")]
+    with pytest.raises(httpx.HTTPStatusError):
+        api.upload_files(files)
+    api.list_files()
+    assert list_route.call_count == 2
 
 
-@respx.mock()
 def test_get_usage_info(respx_mock: respx.MockRouter, ut_api):
     """Test usage info retrieval."""
-    usage_response = {
-        "totalBytes": 1024,
-        "appTotalBytes": 2048,
-        "filesUploaded": 10,
-        "limitBytes": 5000000,
-    }
-
-    respx_mock.post(f"{API_URL}/v6/getUsageInfo").mock(
-        return_value=httpx.Response(200, json=usage_response)
+    route = respx_mock.post(f"{API_URL}/v6/getUsageInfo").mock(
+        return_value=USAGE_RESPONSE
     )
 
     result = ut_api.get_usage_info()
+    assert route.called
     assert isinstance(result, UsageInfoResponse)
     assert result.total_bytes == 1024
     assert result.app_total_bytes == 2048
@@ -269,199 +553,170 @@ def test_get_usage_info(respx_mock: respx.MockRouter, ut_api):
     assert result.limit_bytes == 5000000
 
 
-@respx.mock()
 def test_rename_files(respx_mock: respx.MockRouter, ut_api):
     """Test renaming files with new names."""
-    rename_response = {"success": True, "renamedCount": 2}
-
-    respx_mock.post(f"{API_URL}/v6/renameFiles").mock(
-        return_value=httpx.Response(200, json=rename_response)
+    route = respx_mock.post(f"{API_URL}/v6/renameFiles").mock(
+        return_value=RENAME_RESPONSE
     )
 
-    updates = [
-        {"fileKey": "file_key_1", "newName": "renamed1.jpg"},
-        {"fileKey": "file_key_2", "newName": "renamed2.png"},
-    ]
-
-    result = ut_api.rename_files(updates)
+    result = ut_api.rename_files(RENAME_UPDATES_BY_KEY)
+    assert route.called
     assert isinstance(result, RenameFilesResponse)
     assert result.success is True
 
 
-@respx.mock()
 def test_rename_files_with_custom_id(respx_mock: respx.MockRouter, ut_api):
     """Test renaming files with custom IDs."""
-    rename_response = {"success": True, "renamedCount": 2}
-
-    respx_mock.post(f"{API_URL}/v6/renameFiles").mock(
-        return_value=httpx.Response(200, json=rename_response)
+    route = respx_mock.post(f"{API_URL}/v6/renameFiles").mock(
+        return_value=RENAME_RESPONSE
     )
 
-    updates = [
-        {"customId": "custom_123", "newName": "new_name.jpg"},
-        {"customId": "custom_456", "newName": "other_name.png"},
-    ]
-
-    result = ut_api.rename_files(updates)
+    result = ut_api.rename_files(RENAME_UPDATES_BY_CUSTOM_ID)
+    assert route.called
     assert isinstance(result, RenameFilesResponse)
     assert result.success is True
 
 
-@respx.mock()
 def test_rename_files_mixed_updates(respx_mock: respx.MockRouter, ut_api):
     """Test renaming files with mixed update types (both new names and custom IDs)."""  # noqa: E501
-    rename_response = {"success": True, "renamedCount": 2}
-
-    respx_mock.post(f"{API_URL}/v6/renameFiles").mock(
-        return_value=httpx.Response(200, json=rename_response)
+    route = respx_mock.post(f"{API_URL}/v6/renameFiles").mock(
+        return_value=RENAME_RESPONSE
     )
 
-    updates = [
-        {"fileKey": "file_key_123", "newName": "new_name.jpg"},
-        {"customId": "custom_456", "newName": "other_name.png"},
-    ]
-
-    result = ut_api.rename_files(updates)
+    result = ut_api.rename_files(RENAME_UPDATES_MIXED)
+    assert route.called
     assert isinstance(result, RenameFilesResponse)
     assert result.success is True
 
 
-@respx.mock()
 def test_request_with_error(respx_mock: respx.MockRouter, ut_api):
     """Test handling of request errors."""
     respx_mock.get(f"{API_URL}/test").mock(
         return_value=httpx.Response(400, json={"error": "Bad Request"})
     )
 
-    with pytest.raises(httpx.HTTPError):
+    with pytest.raises(
+        httpx.HTTPStatusError, match="UploadThing API error: 400 - Bad Request"
+    ):
+        ut_api._request("GET", "/test")
+
+
+def test_request_with_non_json_error(respx_mock: respx.MockRouter, ut_api):
+    """Test error responses with a non-JSON body."""
+    respx_mock.get(f"{API_URL}/test").mock(
+        return_value=httpx.Response(502, text="Bad Gateway")
+    )
+
+    with pytest.raises(
+        httpx.HTTPStatusError, match="UploadThing API error: 502 - Bad Gateway"
+    ):
         ut_api._request("GET", "/test")
 
 
-@respx.mock()
+def test_request_with_redirect_status(respx_mock: respx.MockRouter, ut_api):
+    """Test redirect responses are raised rather than parsed as JSON."""
+    respx_mock.post(f"{API_URL}/v6/getUsageInfo").mock(
+        return_value=httpx.Response(
+            307, headers={"location": f"{API_URL}/elsewhere"}
+        )
+    )
+
+    with pytest.raises(
+        httpx.HTTPStatusError, match="UploadThing API error: 307"
+    ):
+        ut_api.get_usage_info()
+
+
 def test_request_with_different_content_types(
     respx_mock: respx.MockRouter, ut_api
 ):
     """Test requests with different content types."""
     test_response = {"key": "value"}
 
-    respx_mock.post(f"{API_URL}/test-json").mock(
+    route = respx_mock.post(f"{API_URL}/test-json").mock(
         return_value=httpx.Response(200, json=test_response)
     )
 
     result = ut_api._request("POST", "/test-json", {"data": "test"})
     assert result == {"key": "value"}
+    request = route.calls.last.request
+    assert request.headers["content-type"] == "application/json"
+    assert request.headers["x-uploadthing-api-key"] == "test-key"
+    assert json_loads(request.content) == {"data": "test"}
 
 
-@respx.mock
 def test_update_acl(respx_mock: respx.MockRouter, ut_api):
     """Test updating ACL settings with file keys."""
-    acl_response = {"success": True, "updatedCount": 2}
-
-    respx_mock.post(f"{API_URL}/v6/updateACL").mock(
-        return_value=httpx.Response(200, json=acl_response)
+    route = respx_mock.post(f"{API_URL}/v6/updateACL").mock(
+        return_value=ACL_RESPONSE
     )
 
-    updates = [
-        {"fileKey": "file_key_1", "acl": ACLValue.PRIVATE.value},
-        {"fileKey": "file_key_2", "acl": ACLValue.PUBLIC_READ.value},
-    ]
-
-    result = ut_api.update_acl(updates)
+    result = ut_api.update_acl(ACL_UPDATES_BY_KEY)
+    assert route.called
     assert isinstance(result, UpdateACLResponse)
     assert result.success is True
     assert result.updated_count == 2
 
 
-@respx.mock
 def test_update_acl_with_custom_id(respx_mock: respx.MockRouter, ut_api):
     """Test updating ACL settings with custom IDs."""
-    acl_response = {"success": True, "updatedCount": 2}
-
-    respx_mock.post(f"{API_URL}/v6/updateACL").mock(
-        return_value=httpx.Response(200, json=acl_response)
+    route = respx_mock.post(f"{API_URL}/v6/updateACL").mock(
+        return_value=ACL_RESPONSE
     )
 
-    updates = [
-        {"customId": "custom_123", "acl": ACLValue.PRIVATE.value},
-        {"customId": "custom_456", "acl": ACLValue.PUBLIC_READ.value},
-    ]
-
-    result = ut_api.update_acl(updates)
+    result = ut_api.update_acl(ACL_UPDATES_BY_CUSTOM_ID)
+    assert route.called
     assert isinstance(result, UpdateACLResponse)
     assert result.success is True
     assert result.updated_count == 2
 
 
-@respx.mock
 def test_update_acl_mixed_updates(respx_mock: respx.MockRouter, ut_api):
     """Test updating ACL settings with mixed update types."""
-    acl_response = {"success": True, "updatedCount": 2}
-
-    respx_mock.post(f"{API_URL}/v6/updateACL").mock(
-        return_value=httpx.Response(200, json=acl_response)
+    route = respx_mock.post(f"{API_URL}/v6/updateACL").mock(
+        return_value=ACL_RESPONSE
     )
 
-    updates = [
-        {"fileKey": "file_key_123", "acl": ACLValue.PRIVATE.value},
-        {"customId": "custom_456", "acl": ACLValue.PUBLIC_READ.value},
-    ]
-
-    result = ut_api.update_acl(updates)
+    result = ut_api.update_acl(ACL_UPDATES_MIXED)
+    assert route.called
     assert isinstance(result, UpdateACLResponse)
     assert result.success is True
     assert result.updated_count == 2
 
 
-@respx.mock
-def test_update_acl_with_invalid_acl(respx_mock: respx.MockRouter, ut_api):
+@pytest.mark.parametrize(
+    "acl", ["invalid-acl", ["private"], None], ids=["string", "list", "none"]
+)
+def test_update_acl_with_invalid_acl(ut_api, acl):
     """Test updating ACL settings with invalid ACL value."""
     updates = [
-        {"fileKey": "file_key_1", "acl": "invalid-acl"},
+        {"fileKey": "file_key_1", "acl": acl},
     ]
 
-    mock_post = respx_mock.post(f"{API_URL}/v6/updateACL").mock(
-        return_value=httpx.Response(400, json={"success": False})
-    )
-
     with pytest.raises(
         ValueError, match="ACL must be one of: 'public-read', 'private'"
     ):
         ut_api.update_acl(updates)
-    assert not mock_post.called
 
 
-@respx.mock
-def test_update_acl_with_missing_acl(respx_mock: respx.MockRouter, ut_api):
+def test_update_acl_with_missing_acl(ut_api):
     """Test updating ACL settings with missing ACL field."""
     updates = [
         {"fileKey": "file_key_1"},  # Missing acl field
     ]
 
-    mock_post = respx_mock.post(f"{API_URL}/v6/updateACL").mock(
-        return_value=httpx.Response(400, json={"success": False})
-    )
-
     with pytest.raises(ValueError, match="Missing 'acl' in update"):
         ut_api.update_acl(updates)
-    assert not mock_post.called
 
 
-@respx.mock
-def test_update_acl_with_missing_identifier(
-    respx_mock: respx.MockRouter, ut_api
-):
+def test_update_acl_with_missing_identifier(ut_api):
     """Test updating ACL settings with missing identifier."""
     updates = [
-        {"acl": ACLValue.PUBLIC_READ.value},  # Missing fileKey/customId
+        {"acl": ACL_PUBLIC_READ},  # Missing fileKey/customId
     ]
 
-    mock_post = respx_mock.post(f"{API_URL}/v6/updateACL").mock(
-        return_value=httpx.Response(400, json={"success": False})
-    )
-
     with pytest.raises(
         ValueError,
         match="Each update must contain either 'fileKey' or 'customId'",
     ):
         ut_api.update_acl(updates)
-    assert not mock_post.called
@@ -1,4 +1,13 @@
-from upyloadthing.utils import snakify
+import pytest
+
+from upyloadthing import utils
+from upyloadthing.utils import (
+    _to_snake,
+    json_dumps,
+    json_loads,
+    snakify,
+    snakify_parse,
+)
 
 
 def test_snakify_dict():
@@ -78,3 +87,56 @@ def test_snakify_dict_other():
         "limit_bytes": 5000000,
     }
     assert snakify(input_dict) == expected
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        ("fileKey", "file_key"),
+        ("appId", "app_id"),
+        ("AppTotalBytes", "app_total_bytes"),
+        ("APIKey", "api_key"),
+        ("fileURL", "file_url"),
+        ("HTTPResponseCode", "http_response_code"),
+        ("file2Key", "file2_key"),
+        ("x-ut-file-name", "x_ut_file_name"),
+        ("already_snake", "already_snake"),
+        ("", ""),
+    ],
+)
+def test_snakify_key_rules(key, expected):
+    """Test key conversion of acronyms, digits and dashes."""
+    assert snakify({key: 1}) == {expected: 1}
+
+
+def test_snakify_reuses_key_conversions():
+    """Test repeated keys are converted once and then served from cache."""
+    files = [{"customId": None, "uploadedAt": i} for i in range(10)]
+    snakify(files)
+    hits = _to_snake.cache_info().hits
+    result = snakify(files)
+    assert _to_snake.cache_info().hits == hits + 20
+    assert result[0] == {"custom_id": None, "uploaded_at": 0}
+
+
+def test_json_round_trip():
+    """Test JSON encoding to bytes and decoding back."""
+    data = {"fileKeys": ["a", "b"], "limit": 10, "nested": {"ok": True}}
+    encoded = json_dumps(data)
+    assert isinstance(encoded, bytes)
+    assert json_loads(encoded) == data
+    assert json_loads(encoded.decode()) == data
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_snakify_parse(monkeypatch, use_orjson):
+    """Test parsing JSON to snake_case keys with and without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    raw = b'{"hasMore": false, "files": [{"fileKey": "a", "uploadedAt": 1}]}'
+    expected = {
+        "has_more": False,
+        "files": [{"file_key": "a", "uploaded_at": 1}],
+    }
+    assert snakify_parse(raw) == expected
+    assert snakify_parse(raw.decode()) == expected
@@ -1,5 +1,6 @@
 from upyloadthing.async_client import AsyncUTApi
 from upyloadthing.client import UTApi
+from upyloadthing.exceptions import BatchRequestError
 from upyloadthing.schemas import (
     ACLValue,
     DeleteFileResponse,
@@ -26,4 +27,5 @@ __all__ = [
     "UsageInfoResponse",
     "UploadResult",
     "UpdateACLResponse",
+    "BatchRequestError",
 ]
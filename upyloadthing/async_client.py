@@ -1,5 +1,6 @@
 import asyncio
-from typing import BinaryIO, List
+from types import TracebackType
+from typing import BinaryIO, List, Self
 
 import httpx
 
@@ -11,8 +12,9 @@ from upyloadthing.schemas import (
     UpdateACLResponse,
     UploadResult,
     UsageInfoResponse,
+    UTApiOptions,
 )
-from upyloadthing.utils import snakify
+from upyloadthing.utils import json_loads, snakify
 
 
 class AsyncUTApi(BaseUTApi):
@@ -20,22 +22,56 @@ class AsyncUTApi(BaseUTApi):
 
     This class provides asynchronous methods for interacting with the
     UploadThing API. Use this client for async/await operations.
+
+    The client keeps a pooled HTTP connection open for its whole lifetime;
+    use it as an async context manager (or await `aclose()`) to release it.
+
+    Independent calls can run concurrently over the shared pool, e.g.::
+
+        usage_info, file_list = await asyncio.gather(
+            api.get_usage_info(), api.list_files(limit=5)
+        )
     """
 
+    def __init__(self, options: UTApiOptions | None = None):
+        super().__init__(options)
+        self._client = httpx.AsyncClient(
+            headers=self._headers,
+            transport=httpx.AsyncHTTPTransport(**self._transport_kwargs()),
+            mounts=self._proxy_mounts(httpx.AsyncHTTPTransport),
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
     async def _request(
         self,
         method: str,
         path: str,
         data: dict | None = None,
         timeout: float = 30.0,
+        files: dict | None = None,
     ) -> dict:
         """Make an async HTTP request to the UploadThing API.
 
         Args:
             method: HTTP method to use
             path: API endpoint path
-            data: Request data/parameters
+            data: Request data/parameters, sent as JSON
             timeout: Request timeout in seconds
+            files: Files to send as a multipart body instead of JSON data
 
         Returns:
             dict: Parsed JSON response
@@ -44,29 +80,43 @@ class AsyncUTApi(BaseUTApi):
             httpx.TimeoutException: If the request times out
             httpx.HTTPStatusError: If the server returns an error status
         """
-        url, headers, request_kwargs = self._prepare_request(
-            method, path, data
-        )
-        request_kwargs = request_kwargs or {}
-        request_kwargs.update({"timeout": timeout})
+        cache_key = self._cache_key(method, path, data)
+        if cache_key is not None:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+
+        if files is not None:
+            url, headers, request_kwargs = self._prepare_multipart_request(
+                path, files
+            )
+        else:
+            url, headers, request_kwargs = self._prepare_json_request(
+                path, data
+            )
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method=method, url=url, headers=headers, **request_kwargs
-                )
-                response.raise_for_status()
-                result = snakify(response.json())
-                if isinstance(result, dict):  # Type guard
-                    return result
-                raise TypeError("Expected dict response")
+            response = await self._client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                timeout=timeout,
+                **request_kwargs,
+            )
         except httpx.TimeoutException:
             raise httpx.TimeoutException(
                 f"Request to {url} timed out after {timeout} seconds"
             ) from None
-        except httpx.HTTPStatusError as e:
-            self._handle_error_response(e)
-            raise  # This ensures we always return or raise
+
+        if not response.is_success:
+            self._raise_for_status(response)
+
+        result = json_loads(response.content)
+        if isinstance(result, dict):  # Type guard
+            if cache_key is not None:
+                self._set_cached(cache_key, result)
+            return result
+        raise TypeError("Expected dict response")
 
     async def _upload_single_file(self, file_data: dict) -> UploadResult:
         """Upload a single file to UploadThing.
@@ -80,7 +130,7 @@ class AsyncUTApi(BaseUTApi):
         result = await self._request(
             "PUT",
             file_data["ingest_url"],
-            data={
+            files={
                 "file": (
                     file_data["name"],
                     file_data["file"],
@@ -89,12 +139,43 @@ class AsyncUTApi(BaseUTApi):
             },
         )
 
-        return UploadResult(
-            file_key=file_data["file_key"],
-            name=file_data["name"],
-            size=file_data["size"],
-            type=file_data["type"],
-            **result,
+        # Server fields (including user-defined server data) are converted
+        # to snake_case; the values computed by the SDK take precedence
+        return UploadResult.model_validate(
+            {
+                **snakify(result),
+                "file_key": file_data["file_key"],
+                "name": file_data["name"],
+                "size": file_data["size"],
+                "type": file_data["type"],
+            }
+        )
+
+    async def _post_batches(
+        self, path: str, field: str, batches: List[List]
+    ) -> List[dict | BaseException]:
+        """Send the batches of a bulk request to an API endpoint.
+
+        Batches are sent concurrently, at most max_concurrency at a time;
+        every batch is sent even if another one fails.
+
+        Args:
+            path: API endpoint path
+            field: Request body field holding each batch
+            batches: Keys or update objects to send, split in batches
+
+        Returns:
+            List: Response data, or the raised exception, of each batch, in
+            order
+        """
+        semaphore = asyncio.Semaphore(self._batch_concurrency(len(batches)))
+
+        async def post(batch: List) -> dict:
+            async with semaphore:
+                return await self._request("POST", path, {field: batch})
+
+        return await asyncio.gather(
+            *[post(batch) for batch in batches], return_exceptions=True
         )
 
     async def upload_files(
@@ -113,20 +194,28 @@ class AsyncUTApi(BaseUTApi):
         Returns:
             List[UploadResult]: List of upload results containing file information
         """  # noqa: E501
-        if not isinstance(files, list):
-            files = [files]
-
-        files_data = [
-            self._prepare_file_data(file, content_disposition, acl)
-            for file in files
-        ]
+        # Stat, rewind and sign the files off the event loop so file system
+        # access and HMAC signing don't stall other coroutines
+        files_data = await asyncio.to_thread(
+            self._prepare_files_data, files, content_disposition, acl
+        )
 
-        # Upload all files in parallel
-        results = await asyncio.gather(
-            *[self._upload_single_file(file_data) for file_data in files_data]
+        # Upload all files in parallel, at most max_concurrency at a time
+        semaphore = asyncio.Semaphore(
+            self._upload_concurrency(len(files_data))
         )
 
-        return results
+        async def upload(file_data: dict) -> UploadResult:
+            async with semaphore:
+                return await self._upload_single_file(file_data)
+
+        try:
+            results = await asyncio.gather(
+                *[upload(file_data) for file_data in files_data]
+            )
+        finally:
+            self.invalidate_cache()
+        return list(results)
 
     async def delete_files(
         self, keys: str | List[str], key_type: str | None = "file_key"
@@ -141,11 +230,17 @@ class AsyncUTApi(BaseUTApi):
             DeleteFileResponse: Response containing deletion results
         """
         keys_list = [keys] if isinstance(keys, str) else keys
-        data = {
-            "fileKeys" if key_type == "file_key" else "customIds": keys_list
-        }
-        result = await self._request("POST", "/v6/deleteFiles", data)
-        return DeleteFileResponse(**result)
+        key_field = "fileKeys" if key_type == "file_key" else "customIds"
+        batches = self._batch_items(keys_list)
+        try:
+            outcomes = await self._post_batches(
+                "/v6/deleteFiles", key_field, batches
+            )
+        finally:
+            self.invalidate_cache()
+        return DeleteFileResponse.model_validate(
+            self._merge_batch_results(batches, outcomes, "deletedCount")
+        )
 
     async def list_files(
         self, limit: int | None = None, offset: int | None = None
@@ -159,14 +254,14 @@ class AsyncUTApi(BaseUTApi):
         Returns:
             ListFileResponse: Response containing list of files
         """
-        params = {}
-        if limit:
-            params["limit"] = limit
-        if offset:
-            params["offset"] = offset
+        params = {
+            key: value
+            for key, value in (("limit", limit), ("offset", offset))
+            if value is not None
+        }
 
         response = await self._request("POST", "/v6/listFiles", params)
-        return ListFileResponse(**response)
+        return ListFileResponse.model_validate(response)
 
     async def get_usage_info(self) -> UsageInfoResponse:
         """Get usage information for the UploadThing account asynchronously.
@@ -175,7 +270,7 @@ class AsyncUTApi(BaseUTApi):
             UsageInfoResponse: Response containing usage statistics
         """
         result = await self._request("POST", "/v6/getUsageInfo")
-        return UsageInfoResponse(**result)
+        return UsageInfoResponse.model_validate(result)
 
     async def rename_files(
         self, updates: List[dict[str, str]]
@@ -190,10 +285,16 @@ class AsyncUTApi(BaseUTApi):
         Returns:
             RenameFilesResponse: Response containing rename results
         """
-        result = await self._request(
-            "POST", "/v6/renameFiles", {"updates": updates}
+        batches = self._batch_items(updates)
+        try:
+            outcomes = await self._post_batches(
+                "/v6/renameFiles", "updates", batches
+            )
+        finally:
+            self.invalidate_cache()
+        return RenameFilesResponse.model_validate(
+            self._merge_batch_results(batches, outcomes, "renamedCount")
         )
-        return RenameFilesResponse(**result)
 
     async def update_acl(
         self, updates: List[dict[str, str]]
@@ -210,7 +311,13 @@ class AsyncUTApi(BaseUTApi):
             UpdateACLResponse: Response containing update results
         """
         self._validate_acl_updates(updates)
-        result = await self._request(
-            "POST", "/v6/updateACL", {"updates": updates}
+        batches = self._batch_items(updates)
+        try:
+            outcomes = await self._post_batches(
+                "/v6/updateACL", "updates", batches
+            )
+        finally:
+            self.invalidate_cache()
+        return UpdateACLResponse.model_validate(
+            self._merge_batch_results(batches, outcomes, "updatedCount")
         )
-        return UpdateACLResponse(**result)
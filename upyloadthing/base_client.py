@@ -1,13 +1,20 @@
 import base64
+import io
+import ipaddress
 import json
 import mimetypes
 import os
+import stat
+import time
+import urllib.request
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, BinaryIO, Coroutine, List
+from functools import lru_cache
+from typing import Any, BinaryIO, Coroutine, List, NoReturn
 
 import httpx
 
+from upyloadthing.exceptions import BatchRequestError
 from upyloadthing.file_key import generate_key
 from upyloadthing.presign import make_presigned_url
 from upyloadthing.schemas import (
@@ -20,11 +27,166 @@ from upyloadthing.schemas import (
     UTApiOptions,
     UTtoken,
 )
-from upyloadthing.utils import snakify
+from upyloadthing.utils import json_dumps, json_loads, snakify_parse
 
 SDK_VERSION = "7.4.4"
 BE_ADAPTER = "server-sdk"
 API_URL = "https://api.uploadthing.com"
+INGEST_URL = "https://{region}.ingest.uploadthing.com"
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+DEFAULT_RETRIES = 3
+DEFAULT_MAX_CONCURRENCY = 16
+# Maximum number of keys/updates sent in a single bulk API request
+MAX_ITEMS_PER_REQUEST = 1000
+# Maximum length of a non-JSON error body quoted in error messages
+MAX_ERROR_BODY_LENGTH = 500
+CACHE_MAX_SIZE = 128
+# Read-only endpoints whose responses may be cached when cache_ttl is set
+CACHEABLE_PATHS = frozenset({"/v6/listFiles", "/v6/getUsageInfo"})
+# Accepted ACL values (raw strings and enum members) for update validation
+_ACL_VALUES = frozenset([*ACLValue, *(v.value for v in ACLValue)])
+_ACL_ERROR_MSG = "ACL must be one of: " + ", ".join(
+    repr(v.value) for v in ACLValue
+)
+_IDENT_KEYS = ("fileKey", "customId")
+
+
+@lru_cache(maxsize=256)
+def _guess_type_for_suffix(suffix: str) -> str:
+    """Guess the MIME type for a file name suffix such as ".jpg".
+
+    Args:
+        suffix: Trailing extension(s) of a file name, e.g. ".tar.gz"
+
+    Returns:
+        str: MIME type, defaulting to application/octet-stream
+    """
+    return (
+        mimetypes.guess_type(f"file{suffix}")[0] or "application/octet-stream"
+    )
+
+
+def _guess_type(file_name: str) -> str:
+    """Guess the MIME type of a file from its name.
+
+    mimetypes only looks at the last extension, plus the one before it
+    when the last is an encoding (".tar.gz"), so lookups are cached on
+    those two suffixes rather than on every distinct file name.
+
+    Args:
+        file_name: Name of the file
+
+    Returns:
+        str: MIME type, defaulting to application/octet-stream
+    """
+    root, ext = os.path.splitext(file_name)
+    return _guess_type_for_suffix(os.path.splitext(root)[1] + ext)
+
+
+@lru_cache(maxsize=8)
+def _parse_token(token: str) -> UTtoken:
+    """Decode a base64 encoded UploadThing token.
+
+    Applications often create many short-lived clients from the same
+    token, so decoded tokens are cached; callers must copy the cached
+    instance rather than hand it out.
+
+    Args:
+        token: The base64 encoded token
+
+    Returns:
+        UTtoken: The decoded token
+    """
+    return UTtoken.model_validate(snakify_parse(base64.b64decode(token)))
+
+
+def _file_size(file: BinaryIO) -> int:
+    """Get the total size of a file-like object in bytes.
+
+    In-memory buffers and regular files on disk are sized without seeking;
+    other streams fall back to seeking to their end.
+
+    Args:
+        file: File-like object to measure
+
+    Returns:
+        int: Size of the file in bytes
+    """
+    if isinstance(file, io.BytesIO):
+        with file.getbuffer() as buffer:
+            return buffer.nbytes
+    try:
+        file_stat = os.fstat(file.fileno())
+    except (AttributeError, OSError):
+        pass
+    else:
+        if stat.S_ISREG(file_stat.st_mode):
+            return file_stat.st_size
+    return file.seek(0, 2)
+
+
+def _env_max_concurrency() -> int:
+    """Read the upload concurrency from UPLOADTHING_MAX_CONCURRENCY.
+
+    Returns:
+        int: The configured concurrency, or DEFAULT_MAX_CONCURRENCY when
+        the variable is unset or empty
+
+    Raises:
+        ValueError: If the variable is not a positive integer
+    """
+    value = os.getenv("UPLOADTHING_MAX_CONCURRENCY")
+    if not value:
+        return DEFAULT_MAX_CONCURRENCY
+    try:
+        max_concurrency = int(value)
+    except ValueError:
+        max_concurrency = 0
+    if max_concurrency < 1:
+        raise ValueError(
+            "UPLOADTHING_MAX_CONCURRENCY must be a positive integer, "
+            f"got {value!r}"
+        )
+    return max_concurrency
+
+
+def _environment_proxies() -> dict[str, str | None]:
+    """Read the proxy settings from the environment the way httpx does.
+
+    HTTP_PROXY / HTTPS_PROXY / ALL_PROXY become `scheme://` URL patterns
+    mapped to their proxy URL; hosts listed in NO_PROXY map to None.
+
+    Returns:
+        dict: URL patterns mapped to proxy URLs, or to None for hosts that
+        bypass the proxy
+    """
+    proxy_info = urllib.request.getproxies()
+    proxies: dict[str, str | None] = {}
+    for scheme in ("http", "https", "all"):
+        if proxy_info.get(scheme):
+            url = proxy_info[scheme]
+            proxies[f"{scheme}://"] = url if "://" in url else f"http://{url}"
+
+    for host in (h.strip() for h in proxy_info.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            proxies[host] = None
+            continue
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            address = None
+        if isinstance(address, ipaddress.IPv6Address):
+            proxies[f"all://[{host}]"] = None
+        elif address is not None or host.lower() == "localhost":
+            proxies[f"all://{host}"] = None
+        else:
+            proxies[f"all://*{host}"] = None
+    return proxies
 
 
 class BaseUTApi(ABC):
@@ -36,24 +198,188 @@ class BaseUTApi(ABC):
 
     def __init__(self, options: UTApiOptions | None = None):
         self.options = options or UTApiOptions()
-        b64_token = (
-            options.token if options else os.getenv("UPLOADTHING_TOKEN")
-        )
-        if not b64_token:
+        token = options.token if options else os.getenv("UPLOADTHING_TOKEN")
+        if not token:
             raise ValueError("UPLOADTHING_TOKEN is required")
-        decoded_token = snakify(
-            json.loads(base64.b64decode(b64_token).decode("utf-8"))
-        )
-        self.token = UTtoken.model_validate(decoded_token)
+        if isinstance(token, UTtoken):
+            # Already decoded, e.g. shared by several clients
+            self.token = token
+        else:
+            # Copied so that no client can alter the cached token
+            self.token = _parse_token(token).model_copy(deep=True)
         self.region = (
             options.region
             if options and options.region
             else os.getenv("UPLOADTHING_REGION") or self.token.regions[0]
         )
         self.api_url = API_URL
+        self.ingest_url = INGEST_URL.format(region=self.region)
+        self.max_concurrency = (
+            options.max_concurrency
+            if options and options.max_concurrency
+            else _env_max_concurrency()
+        )
+        self.cache_ttl = (
+            options.cache_ttl if options and options.cache_ttl else 0
+        )
+        self.http2 = options.http2 if options else False
+        self.max_connections = (
+            options.max_connections
+            if options and options.max_connections
+            else DEFAULT_MAX_CONNECTIONS
+        )
+        self.max_keepalive_connections = (
+            options.max_keepalive_connections
+            if options and options.max_keepalive_connections
+            else DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        )
+        self.retries = (
+            options.retries
+            if options and options.retries is not None
+            else DEFAULT_RETRIES
+        )
+        self._cache: dict[tuple[str, str], tuple[float, dict]] = {}
+        self._headers = self._make_headers()
+        # Per-request extras; the clients send self._headers by default
+        self._json_headers = {"content-type": "application/json"}
+
+    def _upload_concurrency(self, file_count: int) -> int:
+        """Number of files to upload at once.
+
+        Bounded by `max_concurrency` and by the connection pool size, so
+        uploads never queue inside the pool (where they could hit its
+        timeout) instead of waiting for their turn.
+
+        Args:
+            file_count: Number of files being uploaded
+
+        Returns:
+            int: Number of parallel uploads, at least 1
+        """
+        return max(
+            1, min(self.max_concurrency, self.max_connections, file_count)
+        )
+
+    def _batch_concurrency(self, batch_count: int) -> int:
+        """Number of bulk request batches to send at once.
+
+        Bounded like uploads, by `max_concurrency` and by the connection
+        pool size, so both clients send the same number of batches in
+        parallel.
+
+        Args:
+            batch_count: Number of batches of the bulk request
+
+        Returns:
+            int: Number of parallel batch requests, at least 1
+        """
+        return max(
+            1, min(self.max_concurrency, self.max_connections, batch_count)
+        )
+
+    def _transport_kwargs(self) -> dict:
+        """Build the keyword arguments used to create the HTTP transport.
+
+        The transport is created once per API instance so that connections
+        (and their TLS sessions) are pooled and reused across requests.
+        With `http2` enabled, concurrent requests to the same host are
+        multiplexed over a single connection (requires `httpx[http2]`).
+        Failed connection attempts are retried up to `retries` times.
+
+        Returns:
+            dict: Keyword arguments for httpx.HTTPTransport /
+            httpx.AsyncHTTPTransport
+        """
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ),
+            "http2": self.http2,
+            "retries": self.retries,
+        }
+
+    def _proxy_mounts(self, transport_cls: type) -> dict:
+        """Build transports for the proxies configured in the environment.
+
+        Passing an explicit transport disables httpx's own HTTP(S)_PROXY /
+        ALL_PROXY / NO_PROXY handling, so the same proxy mounts are built
+        here, using the pooled transport settings.
+
+        Args:
+            transport_cls: httpx.HTTPTransport or httpx.AsyncHTTPTransport
+
+        Returns:
+            dict: URL patterns mapped to proxy transports, or to None for
+            hosts that bypass the proxy
+        """
+        return {
+            pattern: None
+            if proxy_url is None
+            else transport_cls(proxy=proxy_url, **self._transport_kwargs())
+            for pattern, proxy_url in _environment_proxies().items()
+        }
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached list/usage responses.
+
+        Called automatically after any operation that modifies files.
+        """
+        self._cache.clear()
+
+    def _cache_key(
+        self, method: str, path: str, data: dict | None
+    ) -> tuple[str, str] | None:
+        """Build the cache key for a request, if it may be cached.
+
+        Args:
+            method: HTTP method to use
+            path: API endpoint path
+            data: Request data/parameters
+
+        Returns:
+            tuple | None: Cache key, or None if the request is not cacheable
+        """
+        if not self.cache_ttl or method != "POST":
+            return None
+        if path not in CACHEABLE_PATHS:
+            return None
+        return path, json.dumps(data, sort_keys=True)
+
+    def _get_cached(self, key: tuple[str, str]) -> dict | None:
+        """Return a cached response if it has not expired yet.
+
+        Args:
+            key: Cache key built by `_cache_key`
+
+        Returns:
+            dict | None: Cached response data, or None on a miss
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        return result
+
+    def _set_cached(self, key: tuple[str, str], result: dict) -> None:
+        """Store a response in the cache for `cache_ttl` seconds.
+
+        Args:
+            key: Cache key built by `_cache_key`
+            result: Response data to cache
+        """
+        if len(self._cache) >= CACHE_MAX_SIZE:
+            # Evict the oldest entry
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + self.cache_ttl, result)
 
     def _make_headers(self) -> dict:
-        """Create headers required for UploadThing API requests.
+        """Build the headers required for UploadThing API requests.
+
+        Called once at init; the clients send them with every request.
 
         Returns:
             dict: Headers containing SDK version, adapter type, and API key
@@ -159,8 +485,44 @@ class BaseUTApi(ABC):
         """
         pass
 
+    def _prepare_files_data(
+        self,
+        files: BinaryIO | List[BinaryIO],
+        content_disposition: str,
+        acl: str | None,
+    ) -> List[dict]:
+        """Prepare metadata and presigned URLs for a batch of files.
+
+        Presigned URLs are signed locally, so the whole batch is prepared
+        up front without any round trip to the UploadThing API.
+
+        Args:
+            files: Single file or list of files to upload
+            content_disposition: Content disposition header value
+            acl: Access control list setting
+
+        Returns:
+            List[dict]: Prepared file data, in the same order as `files`
+        """
+        if not isinstance(files, list):
+            files = [files]
+
+        # Read the random file seeds of the whole batch at once instead of
+        # making one urandom call per file
+        seeds = os.urandom(16 * len(files)).hex()
+        return [
+            self._prepare_file_data(
+                file, content_disposition, acl, seeds[32 * i : 32 * (i + 1)]
+            )
+            for i, file in enumerate(files)
+        ]
+
     def _prepare_file_data(
-        self, file: BinaryIO, content_disposition: str, acl: str | None
+        self,
+        file: BinaryIO,
+        content_disposition: str,
+        acl: str | None,
+        file_seed: str | None = None,
     ) -> dict:
         """Prepare file metadata and presigned URL for upload.
 
@@ -168,21 +530,29 @@ class BaseUTApi(ABC):
             file: File-like object to upload
             content_disposition: Content disposition header value
             acl: Access control list setting
+            file_seed: Random hex seed of the file key and custom id;
+                generated when not provided
 
         Returns:
             dict: Prepared file data including presigned URL
         """
-        file_seed = uuid.uuid4().hex
+        if file_seed is None:
+            file_seed = uuid.uuid4().hex
         file_key = generate_key(file_seed, self.token.app_id)
-        file_name = getattr(file, "name", f"upload_{uuid.uuid4()}")
-        file_size = file.seek(0, 2)
-        file.seek(0)
-        file_type = (
-            mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+        # Files opened from disk carry their full path as name; unnamed
+        # streams reuse the (already unique) seed instead of a new uuid
+        name = getattr(file, "name", None)
+        file_name = (
+            os.path.basename(name)
+            if isinstance(name, str) and name
+            else f"upload_{file_seed}"
         )
+        file_size = _file_size(file)
+        file.seek(0)
+        file_type = _guess_type(file_name)
 
         ingest_url = make_presigned_url(
-            self.region,
+            self.ingest_url,
             file_key,
             self.token.api_key,
             self.token.app_id,
@@ -204,59 +574,137 @@ class BaseUTApi(ABC):
             "ingest_url": ingest_url,
         }
 
-    def _prepare_request(
-        self, method: str, path: str, data: dict | None = None
-    ) -> tuple[str, dict, dict | None]:
-        """Prepare common request parameters.
+    def _make_url(self, path: str) -> str:
+        """Resolve an API endpoint path to a full URL.
+
+        Args:
+            path: API endpoint path, or an absolute URL used as is
+
+        Returns:
+            str: The request URL
+        """
+        return f"{self.api_url}{path}" if path.startswith("/") else path
+
+    def _prepare_json_request(
+        self, path: str, data: dict | None = None
+    ) -> tuple[str, dict | None, dict]:
+        """Prepare the parameters of a JSON API request.
 
         Args:
-            method: HTTP method to use
             path: API endpoint path
-            data: Request data/parameters
+            data: Request body, sent as JSON when provided
 
         Returns:
-            tuple: (url, headers, prepared_data)
+            tuple: (url, extra headers, request_kwargs)
         """
-        if path.startswith("/"):
-            url = f"{self.api_url}{path}"
-        else:
-            url = path
+        url = self._make_url(path)
+        if data is None:
+            return url, None, {}
+        return url, self._json_headers, {"content": json_dumps(data)}
 
-        headers = self._make_headers()
+    def _prepare_multipart_request(
+        self, path: str, files: dict
+    ) -> tuple[str, dict | None, dict]:
+        """Prepare the parameters of a multipart file upload request.
 
-        def is_file_like(obj):
-            return hasattr(obj, "read") and callable(obj.read)
+        Args:
+            path: Upload URL or API endpoint path
+            files: Multipart fields as (name, file, content type) tuples
 
-        if isinstance(data, dict):
-            has_files = any(
-                isinstance(v, tuple) and len(v) >= 2 and is_file_like(v[1])
-                for v in data.values()
-            )
-            if has_files:
-                return url, headers, {"files": data}
-            return url, headers, {"json": data}
+        Returns:
+            tuple: (url, extra headers, request_kwargs)
+        """
+        return self._make_url(path), None, {"files": files}
 
-        return url, headers, None
+    def _batch_items(self, items: List[Any]) -> List[List[Any]]:
+        """Split bulk request items into batches the API accepts.
 
-    def _handle_error_response(self, e: httpx.HTTPStatusError) -> None:
-        """Handle HTTP error responses consistently.
+        Args:
+            items: Keys or update objects to send
+
+        Returns:
+            List[List]: Batches of at most MAX_ITEMS_PER_REQUEST items; an
+            empty input still yields a single (empty) batch
+        """
+        if not items:
+            return [items]
+        return [
+            items[i : i + MAX_ITEMS_PER_REQUEST]
+            for i in range(0, len(items), MAX_ITEMS_PER_REQUEST)
+        ]
+
+    def _merge_batch_results(
+        self,
+        batches: List[List[Any]],
+        outcomes: List[dict | BaseException],
+        count_field: str,
+    ) -> dict:
+        """Combine the responses of a batched bulk request.
+
+        Args:
+            batches: Items sent in each batch
+            outcomes: Response data, or the raised exception, of each batch
+            count_field: API (camelCase) name of the field counting
+                affected files
+
+        Returns:
+            dict: Merged response data
+
+        Raises:
+            BatchRequestError: If some batches of a split request failed;
+                a request sent as a single batch re-raises its own error
+        """
+        results: List[dict] = []
+        completed: List[Any] = []
+        failed: List[Any] = []
+        errors: List[Exception] = []
+        for batch, outcome in zip(batches, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                failed.extend(batch)
+                errors.append(outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                completed.extend(batch)
+                results.append(outcome)
+
+        merged = {
+            "success": all(result["success"] for result in results),
+            count_field: sum(result[count_field] for result in results),
+        }
+        if errors:
+            if len(batches) == 1:
+                raise errors[0]
+            raise BatchRequestError(
+                merged, completed, failed, errors
+            ) from errors[0]
+        return merged
+
+    def _raise_for_status(self, response: httpx.Response) -> NoReturn:
+        """Raise a descriptive error for an HTTP error response.
+
+        The response body is parsed once to extract the API error message,
+        falling back to the start of the raw body if it isn't JSON.
 
         Args:
-            e: The HTTP error exception
+            response: The HTTP error response
 
         Raises:
-            httpx.HTTPStatusError: Enhanced error with more details
+            httpx.HTTPStatusError: Error with the API error details
         """
-        error_msg = f"UploadThing API error: {e.response.status_code}"
+        error_msg = f"UploadThing API error: {response.status_code}"
         try:
-            error_data = e.response.json()
-            if "error" in error_data:
+            error_data = json_loads(response.content)
+        except ValueError:
+            body = response.content.decode("utf-8", errors="replace")
+            if body:
+                error_msg += f" - {body[:MAX_ERROR_BODY_LENGTH]}"
+        else:
+            if isinstance(error_data, dict) and "error" in error_data:
                 error_msg += f" - {error_data['error']}"
-        except Exception:
-            pass
         raise httpx.HTTPStatusError(
-            error_msg, request=e.request, response=e.response
-        ) from e
+            error_msg, request=response.request, response=response
+        )
 
     def _validate_acl_updates(self, updates: List[dict[str, str]]) -> None:
         """Validate ACL update requests.
@@ -270,7 +718,7 @@ class BaseUTApi(ABC):
         """
         for update in updates:
             # Check for required identifier
-            if not any(key in update for key in ["fileKey", "customId"]):
+            if update.keys().isdisjoint(_IDENT_KEYS):
                 raise ValueError(
                     "Each update must contain either 'fileKey' or 'customId'"
                 )
@@ -278,9 +726,6 @@ class BaseUTApi(ABC):
             # Check for ACL value
             if "acl" not in update:
                 raise ValueError("Missing 'acl' in update")
-            try:
-                ACLValue(update["acl"])  # Validate enum value
-            except ValueError as e:
-                raise ValueError(
-                    f"ACL must be one of: {', '.join(f"'{v.value}'" for v in ACLValue)}"  # noqa: E501
-                ) from e
+            acl = update["acl"]
+            if not isinstance(acl, (str, ACLValue)) or acl not in _ACL_VALUES:
+                raise ValueError(_ACL_ERROR_MSG)
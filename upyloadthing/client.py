@@ -1,4 +1,6 @@
-from typing import BinaryIO, List
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import BinaryIO, List, Self
 
 import httpx
 
@@ -10,8 +12,9 @@ from upyloadthing.schemas import (
     UpdateACLResponse,
     UploadResult,
     UsageInfoResponse,
+    UTApiOptions,
 )
-from upyloadthing.utils import snakify
+from upyloadthing.utils import json_loads, snakify
 
 
 class UTApi(BaseUTApi):
@@ -19,22 +22,50 @@ class UTApi(BaseUTApi):
 
     This class provides synchronous methods for interacting with the
     UploadThing API. Use this client for standard synchronous operations.
+
+    The client keeps a pooled HTTP connection open for its whole lifetime;
+    use it as a context manager (or call `close()`) to release it.
     """
 
+    def __init__(self, options: UTApiOptions | None = None):
+        super().__init__(options)
+        self._client = httpx.Client(
+            headers=self._headers,
+            transport=httpx.HTTPTransport(**self._transport_kwargs()),
+            mounts=self._proxy_mounts(httpx.HTTPTransport),
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        self._client.close()
+
     def _request(
         self,
         method: str,
         path: str,
         data: dict | None = None,
         timeout: float = 30.0,
+        files: dict | None = None,
     ) -> dict:
         """Make an HTTP request to the UploadThing API.
 
         Args:
             method: HTTP method to use
             path: API endpoint path
-            data: Request data/parameters
+            data: Request data/parameters, sent as JSON
             timeout: Request timeout in seconds
+            files: Files to send as a multipart body instead of JSON data
 
         Returns:
             dict: Parsed JSON response
@@ -43,29 +74,105 @@ class UTApi(BaseUTApi):
             httpx.TimeoutException: If the request times out
             httpx.HTTPStatusError: If the server returns an error status
         """
-        url, headers, request_kwargs = self._prepare_request(
-            method, path, data
-        )
-        request_kwargs = request_kwargs or {}
-        request_kwargs.update({"timeout": timeout})
+        cache_key = self._cache_key(method, path, data)
+        if cache_key is not None:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+
+        if files is not None:
+            url, headers, request_kwargs = self._prepare_multipart_request(
+                path, files
+            )
+        else:
+            url, headers, request_kwargs = self._prepare_json_request(
+                path, data
+            )
 
         try:
-            with httpx.Client() as client:
-                response = client.request(
-                    method=method, url=url, headers=headers, **request_kwargs
-                )
-                response.raise_for_status()
-                result = snakify(response.json())
-                if isinstance(result, dict):  # Type guard
-                    return result
-                raise TypeError("Expected dict response")
+            response = self._client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                timeout=timeout,
+                **request_kwargs,
+            )
         except httpx.TimeoutException:
             raise httpx.TimeoutException(
                 f"Request to {url} timed out after {timeout} seconds"
             ) from None
-        except httpx.HTTPStatusError as e:
-            self._handle_error_response(e)
-            raise  # This ensures we always return or raise
+
+        if not response.is_success:
+            self._raise_for_status(response)
+
+        result = json_loads(response.content)
+        if isinstance(result, dict):  # Type guard
+            if cache_key is not None:
+                self._set_cached(cache_key, result)
+            return result
+        raise TypeError("Expected dict response")
+
+    def _upload_single_file(self, file_data: dict) -> UploadResult:
+        """Upload a single file to UploadThing.
+
+        Args:
+            file_data: Dictionary containing file metadata and content
+
+        Returns:
+            UploadResult: Result of the upload operation
+        """
+        result = self._request(
+            "PUT",
+            file_data["ingest_url"],
+            files={
+                "file": (
+                    file_data["name"],
+                    file_data["file"],
+                    file_data["type"],
+                )
+            },
+        )
+
+        # Server fields (including user-defined server data) are converted
+        # to snake_case; the values computed by the SDK take precedence
+        return UploadResult.model_validate(
+            {
+                **snakify(result),
+                "file_key": file_data["file_key"],
+                "name": file_data["name"],
+                "size": file_data["size"],
+                "type": file_data["type"],
+            }
+        )
+
+    def _post_batches(
+        self, path: str, field: str, batches: List[List]
+    ) -> List[dict | BaseException]:
+        """Send the batches of a bulk request to an API endpoint.
+
+        Several batches are sent in parallel over the shared connection
+        pool, at most max_concurrency at a time. Every batch is sent even
+        if another one fails.
+
+        Args:
+            path: API endpoint path
+            field: Request body field holding each batch
+            batches: Keys or update objects to send, split in batches
+
+        Returns:
+            List: Response data, or the raised exception, of each batch, in
+            order
+        """
+        if len(batches) == 1:
+            return [self._request("POST", path, {field: batches[0]})]
+
+        workers = self._batch_concurrency(len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._request, "POST", path, {field: batch})
+                for batch in batches
+            ]
+        return [future.exception() or future.result() for future in futures]
 
     def upload_files(
         self,
@@ -83,37 +190,18 @@ class UTApi(BaseUTApi):
         Returns:
             List[UploadResult]: List of upload results containing file information
         """  # noqa: E501
-        if not isinstance(files, list):
-            files = [files]
-
-        files_data = [
-            self._prepare_file_data(file, content_disposition, acl)
-            for file in files
-        ]
-
-        results = []
-        for file_data in files_data:
-            result = self._request(
-                "PUT",
-                file_data["ingest_url"],
-                {
-                    "file": (
-                        file_data["name"],
-                        file_data["file"],
-                        file_data["type"],
-                    )
-                },
-            )
-
-            upload_result = UploadResult(
-                file_key=file_data["file_key"],
-                name=file_data["name"],
-                size=file_data["size"],
-                type=file_data["type"],
-                **result,
-            )
-            results.append(upload_result)
+        files_data = self._prepare_files_data(files, content_disposition, acl)
 
+        # Upload all files in parallel over the shared connection pool, at
+        # most max_concurrency at a time
+        workers = self._upload_concurrency(len(files_data))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(self._upload_single_file, files_data)
+                )
+        finally:
+            self.invalidate_cache()
         return results
 
     def delete_files(
@@ -129,11 +217,17 @@ class UTApi(BaseUTApi):
             DeleteFileResponse: Response containing deletion results
         """
         keys_list = [keys] if isinstance(keys, str) else keys
-        data = {
-            "fileKeys" if key_type == "file_key" else "customIds": keys_list
-        }
-        result = self._request("POST", "/v6/deleteFiles", data)
-        return DeleteFileResponse(**result)
+        key_field = "fileKeys" if key_type == "file_key" else "customIds"
+        batches = self._batch_items(keys_list)
+        try:
+            outcomes = self._post_batches(
+                "/v6/deleteFiles", key_field, batches
+            )
+        finally:
+            self.invalidate_cache()
+        return DeleteFileResponse.model_validate(
+            self._merge_batch_results(batches, outcomes, "deletedCount")
+        )
 
     def list_files(
         self, limit: int | None = None, offset: int | None = None
@@ -147,14 +241,14 @@ class UTApi(BaseUTApi):
         Returns:
             ListFileResponse: Response containing list of files
         """
-        params = {}
-        if limit:
-            params["limit"] = limit
-        if offset:
-            params["offset"] = offset
+        params = {
+            key: value
+            for key, value in (("limit", limit), ("offset", offset))
+            if value is not None
+        }
 
         response = self._request("POST", "/v6/listFiles", params)
-        return ListFileResponse(**response)
+        return ListFileResponse.model_validate(response)
 
     def get_usage_info(self) -> UsageInfoResponse:
         """Get usage information for the UploadThing account synchronously.
@@ -163,7 +257,7 @@ class UTApi(BaseUTApi):
             UsageInfoResponse: Response containing usage statistics
         """
         result = self._request("POST", "/v6/getUsageInfo")
-        return UsageInfoResponse(**result)
+        return UsageInfoResponse.model_validate(result)
 
     def rename_files(
         self, updates: List[dict[str, str]]
@@ -178,8 +272,16 @@ class UTApi(BaseUTApi):
         Returns:
             RenameFilesResponse: Response containing rename results
         """
-        result = self._request("POST", "/v6/renameFiles", {"updates": updates})
-        return RenameFilesResponse(**result)
+        batches = self._batch_items(updates)
+        try:
+            outcomes = self._post_batches(
+                "/v6/renameFiles", "updates", batches
+            )
+        finally:
+            self.invalidate_cache()
+        return RenameFilesResponse.model_validate(
+            self._merge_batch_results(batches, outcomes, "renamedCount")
+        )
 
     def update_acl(self, updates: List[dict[str, str]]) -> UpdateACLResponse:
         """Update ACL settings for one or more files synchronously.
@@ -194,5 +296,11 @@ class UTApi(BaseUTApi):
             UpdateACLResponse: Response containing update results
         """
         self._validate_acl_updates(updates)
-        result = self._request("POST", "/v6/updateACL", {"updates": updates})
-        return UpdateACLResponse(**result)
+        batches = self._batch_items(updates)
+        try:
+            outcomes = self._post_batches("/v6/updateACL", "updates", batches)
+        finally:
+            self.invalidate_cache()
+        return UpdateACLResponse.model_validate(
+            self._merge_batch_results(batches, outcomes, "updatedCount")
+        )
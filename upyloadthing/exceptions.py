@@ -0,0 +1,33 @@
+from typing import Any, List
+
+
+class BatchRequestError(Exception):
+    """Raised when some batches of a bulk request failed.
+
+    Bulk operations (`delete_files`, `rename_files`, `update_acl`) are sent
+    in batches of at most 1000 items. Batches are applied independently, so
+    when one fails the others may already have been applied; this error
+    reports what was done. The first batch error is chained as `__cause__`.
+
+    Attributes:
+        result: Merged response data of the batches that succeeded
+        completed: Items of the batches that succeeded
+        failed: Items of the batches that failed
+        errors: Exception raised by each failed batch, in order
+    """
+
+    def __init__(
+        self,
+        result: dict,
+        completed: List[Any],
+        failed: List[Any],
+        errors: List[Exception],
+    ):
+        super().__init__(
+            f"{len(failed)} of {len(completed) + len(failed)} items failed: "
+            f"{errors[0]}"
+        )
+        self.result = result
+        self.completed = completed
+        self.failed = failed
+        self.errors = errors
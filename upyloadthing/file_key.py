@@ -1,17 +1,19 @@
 import base64
-import math
+from functools import lru_cache
 
 from sqids.constants import DEFAULT_ALPHABET
 from sqids.sqids import Sqids
 
 
+@lru_cache(maxsize=64)
 def djb2(s: str) -> int:
     """
     Compute a hash of the input string using the djb2 algorithm.
 
     This implementation processes the characters in reverse order and
     applies the djb2 algorithm with a twist for 32-bit overflow handling.
-    It then adjusts the result to a signed 32-bit integer.
+    It then adjusts the result to a signed 32-bit integer. Results are
+    cached, as the hashed strings (application ids) rarely change.
 
     Args:
         s (str): The input string to be hashed.
@@ -20,8 +22,8 @@ def djb2(s: str) -> int:
         int: A signed 32-bit hash of the input string.
     """
     h = 5381
-    for char in reversed(s):
-        h = (h * 33) ^ ord(char)
+    for code in map(ord, reversed(s)):
+        h = (h * 33) ^ code
         # 32-bit integer overflow
         h &= 0xFFFFFFFF
     h = (h & 0xBFFFFFFF) | ((h >> 1) & 0x40000000)
@@ -50,14 +52,37 @@ def shuffle(string: str, seed: str) -> str:
     """
     chars = list(string)
     seed_num = djb2(seed)
-
-    for i in range(len(chars)):
-        j = int(math.fmod(math.fmod(seed_num, i + 1) + i, len(chars)))
+    # Integer equivalent of JavaScript's `%` (math.fmod): the remainder
+    # takes the sign of the (possibly negative) seed
+    sign = -1 if seed_num < 0 else 1
+    magnitude = abs(seed_num)
+    length = len(chars)
+
+    for i in range(length):
+        j = (sign * (magnitude % (i + 1)) + i) % length
         chars[i], chars[j] = chars[j], chars[i]
 
     return "".join(chars)
 
 
+@lru_cache(maxsize=64)
+def _encode_app_id(app_id: str) -> str:
+    """
+    Encode an application identifier into the prefix of its file keys.
+
+    The prefix only depends on the application id, so it is computed once
+    per id rather than for every generated key.
+
+    Args:
+        app_id (str): The application identifier.
+
+    Returns:
+        str: The Sqids encoding of the application id.
+    """
+    alphabet = shuffle(DEFAULT_ALPHABET, app_id)
+    return Sqids(alphabet, min_length=12).encode([abs(djb2(app_id))])
+
+
 def generate_key(file_seed: str, app_id: str) -> str:
     """
     Generate a unique key using a file seed and an application identifier.
@@ -76,8 +101,5 @@ def generate_key(file_seed: str, app_id: str) -> str:
     Returns:
         str: The generated unique key.
     """
-    alphabet = shuffle(DEFAULT_ALPHABET, app_id)
-
-    encoded_app_id = Sqids(alphabet, min_length=12).encode([abs(djb2(app_id))])
     encoded_file_seed = base64.urlsafe_b64encode(file_seed.encode()).decode()
-    return encoded_app_id + encoded_file_seed
+    return _encode_app_id(app_id) + encoded_file_seed
@@ -1,11 +1,12 @@
 import hashlib
 import hmac
 import time
-from urllib.parse import urlencode
+from functools import lru_cache
+from urllib.parse import quote_plus
 
 
 def make_presigned_url(
-    region_alias: str,
+    ingest_url: str,
     file_key: str,
     api_key: str,
     app_id: str,
@@ -25,8 +26,8 @@ def make_presigned_url(
     secure access to the upload endpoint.
 
     Args:
-        region_alias (str): The region alias to be used in the URL (e.g.,
-                            "us-east"). This is a subdomain for the base URL.
+        ingest_url (str): The base URL of the regional ingest server (e.g.,
+                          "https://sea1.ingest.uploadthing.com").
         file_key (str): The unique file key or identifier used in the URL path.
         api_key (str): The API key used to generate the HMAC-SHA256 signature.
         app_id (str): The application identifier.
@@ -45,31 +46,29 @@ def make_presigned_url(
         can be used to securely upload the file.
     """
     expires = int(time.time() * 1000) + 60 * 60 * 1000  # 1 hour from now
-    params = {
-        "expires": expires,
-        "x-ut-identifier": app_id,
-        "x-ut-file-name": file_name,
-        "x-ut-file-size": file_size,
-    }
-
-    # Optional parameters: add if provided
+
+    # Encode the parameters in a fixed order, exactly as `urlencode` would;
+    # optional parameters are only added if provided
+    query = [
+        f"expires={expires}",
+        f"x-ut-identifier={quote_plus(app_id, safe='')}",
+        f"x-ut-file-name={quote_plus(file_name, safe='')}",
+        f"x-ut-file-size={file_size}",
+    ]
     if file_type:
-        params["x-ut-file-type"] = file_type
+        query.append(f"x-ut-file-type={quote_plus(file_type, safe='')}")
     if custom_id:
-        params["x-ut-custom-id"] = custom_id
+        query.append(f"x-ut-custom-id={quote_plus(custom_id, safe='')}")
     if content_disposition:
-        params["x-ut-content-disposition"] = content_disposition
+        query.append(
+            "x-ut-content-disposition="
+            + quote_plus(content_disposition, safe="")
+        )
     if acl:
-        params["x-ut-acl"] = acl
-
-    # Construct the base URL.
-    base_url = f"https://{region_alias}.ingest.uploadthing.com/{file_key}"
-
-    # Encode the parameters.
-    encoded_params = urlencode(params)
+        query.append(f"x-ut-acl={quote_plus(acl, safe='')}")
 
     # Construct the URL with parameters.
-    url = f"{base_url}?{encoded_params}"
+    url = f"{ingest_url}/{file_key}?{'&'.join(query)}"
 
     # Calculate the signature using HMAC-SHA256.
     signature = hmac_sha256(url, api_key)
@@ -80,6 +79,23 @@ def make_presigned_url(
     return url_with_signature
 
 
+@lru_cache(maxsize=8)
+def _hmac_prototype(api_key: str) -> hmac.HMAC:
+    """
+    Build an HMAC-SHA256 object keyed with the given API key.
+
+    The key setup is done once per API key; each signature is computed on
+    a copy of the returned object, which must not be updated directly.
+
+    Args:
+        api_key (str): The secret API key.
+
+    Returns:
+        hmac.HMAC: An HMAC object with no message data yet.
+    """
+    return hmac.new(api_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+
 def hmac_sha256(url: str, api_key: str) -> str:
     """
     Calculates the HMAC-SHA256 signature of the given URL.
@@ -95,8 +111,7 @@ def hmac_sha256(url: str, api_key: str) -> str:
         str: A string containing the HMAC-SHA256 signature prefixed with
              "hmac-sha256=".
     """
-    message = url.encode("utf-8")
-    secret = api_key.encode("utf-8")
-    hmac_obj = hmac.new(secret, message, hashlib.sha256)
+    hmac_obj = _hmac_prototype(api_key).copy()
+    hmac_obj.update(url.encode("utf-8"))
     signature = hmac_obj.hexdigest()
     return f"hmac-sha256={signature}"
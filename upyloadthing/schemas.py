@@ -1,7 +1,12 @@
 from enum import Enum
 from typing import Dict, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+# API responses use camelCase keys; validate them directly against the
+# snake_case fields instead of renaming every key beforehand
+_RESPONSE_CONFIG = ConfigDict(alias_generator=to_camel, populate_by_name=True)
 
 
 class ACLValue(Enum):
@@ -9,18 +14,26 @@ class ACLValue(Enum):
     PRIVATE = "private"
 
 
-class UTApiOptions(BaseModel):
-    token: str | None = None
-    region: str | None = None
-
-
 class UTtoken(BaseModel):
     api_key: str
     app_id: str
     regions: List[str]
 
 
+class UTApiOptions(BaseModel):
+    token: str | UTtoken | None = None
+    region: str | None = None
+    max_concurrency: int | None = None
+    cache_ttl: float | None = None
+    http2: bool = False
+    max_connections: int | None = None
+    max_keepalive_connections: int | None = None
+    retries: int | None = None
+
+
 class FileData(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     id: str
     custom_id: str | None = None
     key: str
@@ -31,21 +44,29 @@ class FileData(BaseModel):
 
 
 class ListFileResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     has_more: bool
     files: List[FileData]
 
 
 class DeleteFileResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     success: bool
     deleted_count: int
 
 
 class RenameFilesResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     success: bool
     renamed_count: int
 
 
 class UsageInfoResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     total_bytes: int
     app_total_bytes: int
     files_uploaded: int
@@ -53,6 +74,8 @@ class UsageInfoResponse(BaseModel):
 
 
 class UpdateACLResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     success: bool
     updated_count: int
 
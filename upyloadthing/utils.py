@@ -1,6 +1,77 @@
+import json
+from functools import lru_cache
 from typing import Any
 
-from inflection import underscore
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes.
+
+    Uses orjson when it is installed and falls back to the standard
+    library json module otherwise.
+
+    Args:
+        data (Any): The JSON-serializable data to encode.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Deserialize a JSON document.
+
+    Uses orjson when it is installed and falls back to the standard
+    library json module otherwise.
+
+    Args:
+        data (bytes | str): The JSON document to decode.
+
+    Returns:
+        Any: The decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1024)
+def _to_snake(name: str) -> str:
+    """Convert a single camelCase key to snake_case.
+
+    Follows the same rules as `inflection.underscore` in a single pass
+    without regular expressions: an underscore is inserted before an
+    uppercase letter that follows a lowercase letter or digit, or that
+    ends an acronym (``"APIKey"`` -> ``"api_key"``), dashes become
+    underscores and the result is lowercased. API payloads repeat the
+    same handful of field names, so conversions are memoized.
+
+    Args:
+        name (str): The key to convert.
+
+    Returns:
+        str: The snake_case key
+    """
+    chars = []
+    last = len(name) - 1
+    prev = ""
+    for i, char in enumerate(name):
+        if "A" <= char <= "Z" and (
+            "a" <= prev <= "z"
+            or prev.isdecimal()
+            or ("A" <= prev <= "Z" and i < last and "a" <= name[i + 1] <= "z")
+        ):
+            chars.append("_")
+        chars.append(char)
+        prev = char
+    return "".join(chars).replace("-", "_").lower()
 
 
 def snakify(data: Any) -> Any:
@@ -22,7 +93,31 @@ def snakify(data: Any) -> Any:
         snake_case
     """
     if isinstance(data, dict):
-        return {underscore(key): snakify(value) for key, value in data.items()}
+        return {_to_snake(key): snakify(value) for key, value in data.items()}
     elif isinstance(data, list):
         return [snakify(item) for item in data]
     return data
+
+
+def _snake_object(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    """Build a decoded JSON object with its keys converted to snake_case."""
+    return {_to_snake(key): value for key, value in pairs}
+
+
+def snakify_parse(data: bytes | str) -> Any:
+    """Deserialize a JSON document with snake_case dictionary keys.
+
+    Equivalent to ``snakify(json_loads(data))``. Without orjson, keys are
+    renamed while the standard library builds each object, so only one
+    dict tree is allocated; with orjson, its faster parse is followed by
+    `snakify`.
+
+    Args:
+        data (bytes | str): The JSON document to decode.
+
+    Returns:
+        Any: The decoded data with all dictionary keys in snake_case
+    """
+    if orjson is not None:
+        return snakify(orjson.loads(data))
+    return json.loads(data, object_pairs_hook=_snake_object)